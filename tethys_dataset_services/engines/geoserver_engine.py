@@ -1,4 +1,6 @@
 from builtins import *  # noqa: F403, F401
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from jinja2 import Template
 import logging
 import os
@@ -6,10 +8,13 @@ import shutil
 import tempfile
 import pprint
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from io import BytesIO
 from urllib.parse import urlparse
 from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+from urllib3.util.retry import Retry
 from zipfile import ZipFile, is_zipfile
 
 import geoserver
@@ -29,6 +34,15 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
     XML_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'resources', 'geoserver', 'xml_templates')
     WARNING_STATUS_CODES = [403, 404]
 
+    # Maximum number of REST requests sent at once by reload(), gwc_reload() and the bulk methods
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # Times a REST request is retried, with backoff, when the connection to GeoServer cannot be made
+    CONNECT_RETRIES = 3
+
+    # Bytes of the REST landing page read by validate(), enough to include its title
+    VALIDATE_READ_BYTES = 4096
+
     GWC_OP_SEED = 'seed'
     GWC_OP_RESEED = 'reseed'
     GWC_OP_TRUNCATE = 'truncate'
@@ -50,6 +64,8 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         GWC_STATUS_RUNNING: 'Running',
         GWC_STATUS_DONE: 'Done'
     }
+    # columns of the rows in a GWC seed status "long-array-array"
+    GWC_TASK_FIELDS = ('tiles_processed', 'total_to_process', 'num_remaining', 'task_id', 'task_status')
 
     # coverage types
     CT_AIG = 'AIG'
@@ -97,6 +113,16 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             )
         return self._catalog
 
+    @property
+    def session(self):
+        # Shared HTTP session, so REST calls the catalog does not cover reuse pooled keep-alive connections
+        return self._session
+
+    @property
+    def auth(self):
+        # One credentials object for every REST call
+        return self._auth
+
     def __init__(self, endpoint, apikey=None, username=None, password=None, public_endpoint=None, node_ports=None):
         """
         Default constructor for Dataset Engines.
@@ -111,10 +137,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         # Set custom property /geoserver/rest/ -> /geoserver/gwc/rest/
         if public_endpoint:
             self.public_endpoint = public_endpoint
-        if '/' == endpoint[-1]:
-            self._gwc_endpoint = endpoint.replace('rest', 'gwc/rest')
-        else:
-            self._gwc_endpoint = endpoint.replace('rest', 'gwc/rest/')
+        self._gwc_endpoint = self._service_endpoint(endpoint, 'gwc/rest')
 
         self.node_ports = node_ports
 
@@ -125,6 +148,14 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             password=password
         )
 
+        # Built here rather than on first use, which may be in several of the concurrent request threads at once.
+        # Only failed connections are retried, the request never reached GeoServer so any method is safe.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(connect=self.CONNECT_RETRIES, read=0, backoff_factor=0.2))
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._auth = HTTPBasicAuth(self.username, self.password)
+
     def __del__(self):
         self.close()
 
@@ -207,13 +238,12 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         else:
             transparent_option = 'false'
 
-        wms_url = '{0}/wms?service=WMS&version={1}&request=GetMap&' \
-                  'layers={2}&styles={3}&' \
-                  'transparent={10}&tiled={9}&' \
-                  'srs={4}&bbox={5}&' \
-                  'width={6}&height={7}&' \
-                  'format={8}'.format(endpoint, version, layer_id, style, srs, bbox, width, height, output_format,
-                                      tiled_option, transparent_option)
+        wms_url = f'{endpoint}/wms?service=WMS&version={version}&request=GetMap&' \
+                  f'layers={layer_id}&styles={style}&' \
+                  f'transparent={transparent_option}&tiled={tiled_option}&' \
+                  f'srs={srs}&bbox={bbox}&' \
+                  f'width={width}&height={height}&' \
+                  f'format={output_format}'
 
         return wms_url
 
@@ -224,14 +254,14 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         """
         endpoint = self._get_non_rest_endpoint()
 
-        wcs_url = '{0}/wcs?service=WCS&version=1.1.0&request=GetCoverage&' \
-                  'identifier={1}&' \
-                  'srs={2}&BoundingBox={3}&' \
-                  'width={5}&height={6}&' \
-                  'format={4}'.format(endpoint, resource_id, srs, bbox, output_format, width, height)
+        wcs_url = f'{endpoint}/wcs?service=WCS&version=1.1.0&request=GetCoverage&' \
+                  f'identifier={resource_id}&' \
+                  f'srs={srs}&BoundingBox={bbox}&' \
+                  f'width={width}&height={height}&' \
+                  f'format={output_format}'
 
         if namespace and isinstance(namespace, str):
-            wcs_url = '{0}&namespace={1}'.format(wcs_url, namespace)
+            wcs_url = f'{wcs_url}&namespace={namespace}'
 
         return wcs_url
 
@@ -242,13 +272,13 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         endpoint = self._get_non_rest_endpoint()
 
         if output_format == 'GML3':
-            wfs_url = '{0}/wfs?service=WFS&version=2.0.0&request=GetFeature&typeNames={1}'.format(endpoint, resource_id)
+            wfs_url = f'{endpoint}/wfs?service=WFS&version=2.0.0&request=GetFeature&typeNames={resource_id}'
         elif output_format == 'GML2':
-            wfs_url = '{0}/wfs?service=WFS&version=1.0.0&request=GetFeature&typeNames={1}&' \
-                      'outputFormat=GML2'.format(endpoint, resource_id)
+            wfs_url = f'{endpoint}/wfs?service=WFS&version=1.0.0&request=GetFeature&typeNames={resource_id}&' \
+                      'outputFormat=GML2'
         else:
-            wfs_url = '{0}/wfs?service=WFS&version=2.0.0&request=GetFeature&typeNames={1}&' \
-                      'outputFormat={2}'.format(endpoint, resource_id, output_format)
+            wfs_url = f'{endpoint}/wfs?service=WFS&version=2.0.0&request=GetFeature&typeNames={resource_id}&' \
+                      f'outputFormat={output_format}'
 
         return wfs_url
 
@@ -273,6 +303,39 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             node_endpoints.append(endpoint)
         return node_endpoints
 
+    def _map_concurrently(self, func, items):
+        """
+        Call func for each item, concurrently if there is more than one, and return the results in order.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _service_endpoint(rest_endpoint, service):
+        """
+        Swap "rest" in a GeoServer REST endpoint for the given service path, with a trailing slash for consistency.
+        Cached, since the tile cache and URL helpers ask for the same few endpoints on every call.
+        """
+        # Only the last "rest" is the REST path, earlier ones can be part of the host (e.g.: forest.example.com)
+        gs_endpoint = service.join(rest_endpoint.rsplit('rest', 1))
+        if not gs_endpoint.endswith('/'):
+            gs_endpoint += '/'
+        return gs_endpoint
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _xml_template(cls, template_name, autoescape=False):
+        """
+        Load and compile one of the XML templates in XML_PATH. Cached, since the templates do not change at runtime.
+        """
+        with open(os.path.join(cls.XML_PATH, template_name), 'r') as template_file:
+            return Template(template_file.read(), autoescape=autoescape)
+
     @staticmethod
     def _handle_debug(return_object, debug):
         """
@@ -397,11 +460,9 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                     if sub_object and not isinstance(sub_object, str):
                         if sub_object.workspace:
                             try:
-                                object_dictionary[attribute] = '{0}:{1}'.format(sub_object.workspace.name,
-                                                                                sub_object.name)
+                                object_dictionary[attribute] = f'{sub_object.workspace.name}:{sub_object.name}'
                             except AttributeError:
-                                object_dictionary[attribute] = '{0}:{1}'.format(sub_object.workspace,
-                                                                                sub_object.name)
+                                object_dictionary[attribute] = f'{sub_object.workspace}:{sub_object.name}'
                         else:
                             object_dictionary[attribute] = sub_object.name
                     elif isinstance(sub_object, str):
@@ -424,7 +485,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                         if style is not None:
                             if not isinstance(style, str):
                                 if style.workspace:
-                                    styles_names.append('{0}:{1}'.format(style.workspace, style.name))
+                                    styles_names.append(f'{style.workspace}:{style.name}')
                                 else:
                                     styles_names.append(style.name)
                             else:
@@ -441,7 +502,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             # Feature Types Get WFS
             if object_dictionary['resource_type'] == 'featureType':
                 if object_dictionary['workspace']:
-                    resource_id = '{0}:{1}'.format(object_dictionary['workspace'], object_dictionary['name'])
+                    resource_id = f"{object_dictionary['workspace']}:{object_dictionary['name']}"
                 else:
                     resource_id = object_dictionary['name']
 
@@ -474,7 +535,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                     miny = nbbox[2]
                     maxy = nbbox[3]
                     srs = resource_object.projection
-                    bbox = '{0},{1},{2},{3}'.format(minx, miny, maxx, maxy)
+                    bbox = f'{minx},{miny},{maxx},{maxy}'
 
                     # Resize the width to be proportionate to the image aspect ratio
                     aspect_ratio = (float(maxx) - float(minx)) / (float(maxy) - float(miny))
@@ -518,7 +579,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                     miny = nbbox[2]
                     maxy = nbbox[3]
                     srs = resource_object.projection
-                    bbox = '{0},{1},{2},{3}'.format(minx, miny, maxx, maxy)
+                    bbox = f'{minx},{miny},{maxx},{maxy}'
 
                     # Resize the width to be proportionate to the image aspect ratio
                     aspect_ratio = (float(maxx) - float(minx)) / (float(maxy) - float(miny))
@@ -577,7 +638,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                     miny = nbbox[2]
                     maxy = nbbox[3]
                     srs = nbbox[4]
-                    bbox = '{0},{1},{2},{3}'.format(minx, miny, maxx, maxy)
+                    bbox = f'{minx},{miny},{maxx},{maxy}'
 
                     # Resize the width to be proportionate to the image aspect ratio
                     aspect_ratio = (float(maxx) - float(minx)) / (float(maxy) - float(miny))
@@ -624,15 +685,9 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             public (bool): return with the public endpoint if True.
         """
         if public and hasattr(self, 'public_endpoint'):
-            gs_endpoint = self.public_endpoint.replace('rest', 'gwc/rest')
-        else:
-            gs_endpoint = self._gwc_endpoint
+            return self._service_endpoint(self.public_endpoint, 'gwc/rest')
 
-        # Add trailing slash for consistency.
-        if not gs_endpoint.endswith('/'):
-            gs_endpoint += '/'
-
-        return gs_endpoint
+        return self._gwc_endpoint
 
     def get_ows_endpoint(self, workspace, public=True):
         """
@@ -643,12 +698,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             public (bool): return with the public endpoint if True.
         """
         gs_endpoint = self.public_endpoint if public and hasattr(self, 'public_endpoint') else self.endpoint
-        gs_endpoint = gs_endpoint.replace('rest', '{0}/ows'.format(workspace))
-
-        # Add trailing slash for consistency.
-        if not gs_endpoint.endswith('/'):
-            gs_endpoint += '/'
-        return gs_endpoint
+        return self._service_endpoint(gs_endpoint, f'{workspace}/ows')
 
     def get_wms_endpoint(self, public=True):
         """
@@ -658,15 +708,12 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             public (bool): return with the public endpoint if True.
         """
         gs_endpoint = self.public_endpoint if public and hasattr(self, 'public_endpoint') else self.endpoint
-        gs_endpoint = gs_endpoint.replace('rest', 'wms')
-
-        # Add trailing slash for consistency.
-        if not gs_endpoint.endswith('/'):
-            gs_endpoint += '/'
-        return gs_endpoint
+        return self._service_endpoint(gs_endpoint, 'wms')
 
     def close(self):
         self.catalog.client.close()
+        if getattr(self, '_session', None):
+            self._session.close()
 
     def reload(self, ports=None, public=True):
         """
@@ -681,22 +728,29 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         log.debug("Catalog Reload URLS: {0}".format(node_endpoints))
 
         response_dict = {'success': True, 'result': None, 'error': []}
-        for endpoint in node_endpoints:
-            try:
-                response = requests.post(f'{endpoint}reload', auth=(self.username, self.password))
-
-                if response.status_code != 200:
-                    msg = "Catalog Reload Status Code {0}: {1}".format(response.status_code, response.text)
-                    exception = requests.RequestException(msg, response=response)
-                    log.error(exception)
-                    response_dict['success'] = False
-                    response_dict['error'].append(msg)
-            except requests.ConnectionError:
-                log.warning('Catalog could not be reloaded on a GeoServer node.')
+        for msg in self._map_concurrently(self._reload_node, node_endpoints):
+            if msg:
+                response_dict['success'] = False
+                response_dict['error'].append(msg)
 
         response_dict.pop('error', None) if not response_dict['error'] else response_dict.pop('result', None)
         return response_dict
 
+    def _reload_node(self, endpoint):
+        """
+        Reload the catalog on one GeoServer node. Returns the error message if the node reported a failure.
+        """
+        try:
+            response = self.session.post(f'{endpoint}reload', auth=self.auth)
+
+            if response.status_code != 200:
+                msg = "Catalog Reload Status Code {0}: {1}".format(response.status_code, response.text)
+                exception = requests.RequestException(msg, response=response)
+                log.error(exception)
+                return msg
+        except requests.ConnectionError:
+            log.warning('Catalog could not be reloaded on a GeoServer node.')
+
     def gwc_reload(self, ports=None, public=True):
         """
         Reload the GeoWebCache configuration from disk.
@@ -711,30 +765,38 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         log.debug("GeoWebCache Reload URLS: {0}".format(node_endpoints))
 
         response_dict = {'success': True, 'result': None, 'error': []}
-        for endpoint in node_endpoints:
-            retries_remaining = 3
-            while retries_remaining > 0:
-                try:
-                    response = requests.post(f'{endpoint}reload', auth=(self.username, self.password))
+        for msg in self._map_concurrently(self._gwc_reload_node, node_endpoints):
+            if msg:
+                response_dict['success'] = False
+                response_dict['error'].append(msg)
 
-                    if response.status_code != 200:
-                        msg = "GeoWebCache Reload Status Code {0}: {1}".format(response.status_code, response.text)
-                        exception = requests.RequestException(msg, response=response)
-                        log.error(exception)
-                        retries_remaining -= 1
-                        if retries_remaining == 0:
-                            response_dict['success'] = False
-                            response_dict['error'].append(msg)
-                        continue
+        response_dict.pop('error', None) if not response_dict['error'] else response_dict.pop('result', None)
+        return response_dict
 
-                except requests.ConnectionError:
-                    log.warning('GeoWebCache could not be reloaded on a GeoServer node.')
+    def _gwc_reload_node(self, endpoint):
+        """
+        Reload GeoWebCache on one GeoServer node, retrying up to three times. Returns the error message if the last
+        attempt failed.
+        """
+        retries_remaining = 3
+        while retries_remaining > 0:
+            try:
+                response = self.session.post(f'{endpoint}reload', auth=self.auth)
+
+                if response.status_code != 200:
+                    msg = "GeoWebCache Reload Status Code {0}: {1}".format(response.status_code, response.text)
+                    exception = requests.RequestException(msg, response=response)
+                    log.error(exception)
                     retries_remaining -= 1
+                    if retries_remaining == 0:
+                        return msg
+                    continue
 
-                break
+            except requests.ConnectionError:
+                log.warning('GeoWebCache could not be reloaded on a GeoServer node.')
+                retries_remaining -= 1
 
-        response_dict.pop('error', None) if not response_dict['error'] else response_dict.pop('result', None)
-        return response_dict
+            break
 
     def list_resources(self, with_properties=False, store=None, workspace=None, debug=False):
         """
@@ -965,9 +1027,8 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                 layer_dict = self._transcribe_geoserver_object(layer)
 
                 # Get layer caching properties (gsconfig doesn't support this)
-                gwc_url = '{0}layers/{1}.xml'.format(self.gwc_endpoint, layer_id)
-                auth = (self.username, self.password)
-                r = requests.get(gwc_url, auth=auth)
+                gwc_url = f'{self.gwc_endpoint}layers/{layer_id}.xml'
+                r = self.session.get(gwc_url, auth=self.auth)
 
                 if r.status_code == 200:
                     root = ElementTree.XML(r.text)
@@ -1184,7 +1245,7 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         url = (self.endpoint + 'workspaces/' + workspace + '/datastores/' + datastore_name
                + '/featuretypes/' + feature_name + '.json')
 
-        response = requests.get(url, auth=(self.username, self.password))
+        response = self.session.get(url, auth=self.auth)
 
         if response.status_code != 200:
             msg = "Get Layer Extent Status Code {0}: {1}".format(response.status_code, response.text)
@@ -1313,11 +1374,11 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         url = self._assemble_url('workspaces', workspace, 'datastores')
 
         # Execute: POST /workspaces/<ws>/datastores
-        response = requests.post(
+        response = self.session.post(
             url=url,
             data=xml,
             headers=headers,
-            auth=(self.username, self.password)
+            auth=self.auth
         )
 
         # Return with error if this doesn't work
@@ -1383,11 +1444,11 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         url = self._assemble_url('workspaces', workspace, 'datastores', name, 'featuretypes')
 
         # Execute: POST /workspaces/<ws>/datastores
-        response = requests.post(
+        response = self.session.post(
             url=url,
             data=xml,
             headers=headers,
-            auth=HTTPBasicAuth(username=self.username, password=self.password)
+            auth=self.auth
         )
 
         if response.status_code != 201:
@@ -1444,23 +1505,19 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             'other_styles': other_styles or []
         }
 
-        # Open sql view template
-        sql_view_path = os.path.join(self.XML_PATH, 'sql_view_template.xml')
+        # Render sql view template
         url = self._assemble_url('workspaces', workspace, 'datastores', store_name, 'featuretypes')
         headers = {
             "Content-type": "text/xml"
         }
-        with open(sql_view_path, 'r') as sql_view_file:
-            text = sql_view_file.read()
-            template = Template(text)
-            xml = template.render(context)
+        xml = self._xml_template('sql_view_template.xml').render(context)
 
         retries_remaining = 3
         while retries_remaining > 0:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
-                auth=(self.username, self.password),
+                auth=self.auth,
                 data=xml,
             )
 
@@ -1489,22 +1546,18 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         )
 
         # GeoWebCache Settings
-        gwc_layer_path = os.path.join(self.XML_PATH, 'gwc_layer_template.xml')
         url = self.get_gwc_endpoint(public=False) + 'layers/' + workspace + ':' + layer_name + '.xml'
         headers = {
             "Content-type": "text/xml"
         }
-        with open(gwc_layer_path, 'r') as gwc_layer_file:
-            text = gwc_layer_file.read()
-            template = Template(text)
-            xml = template.render(context)
+        xml = self._xml_template('gwc_layer_template.xml').render(context)
 
         retries_remaining = 300
         while retries_remaining > 0:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
-                auth=(self.username, self.password),
+                auth=self.auth,
                 data=xml,
             )
 
@@ -1662,12 +1715,12 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             params['update'] = 'overwrite'
 
         # Execute: PUT /workspaces/<ws>/datastores/<ds>/file.shp
-        response = requests.put(
+        response = self.session.put(
             url=url,
             files=files,
             headers=headers,
             params=params,
-            auth=HTTPBasicAuth(username=self.username, password=self.password)
+            auth=self.auth
         )
 
         # Clean up file stuff
@@ -1733,16 +1786,16 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             coverage_type = self.CT_ARC_GRID
 
         # create the store
-        xml = """
+        xml = f"""
               <coverageStore>
                   <name>{name}</name>
-                  <type>{type}</type>
+                  <type>{coverage_type}</type>
                   <enabled>true</enabled>
                   <workspace>
                       <name>{workspace}</name>
                   </workspace>
               </coverageStore>
-              """.format(name=name, type=coverage_type, workspace=workspace)
+              """
 
         # Prepare headers
         headers = {
@@ -1754,11 +1807,11 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         url = self._assemble_url('workspaces', workspace, 'coveragestores')
 
         # Execute: POST /workspaces/<ws>/coveragestores
-        response = requests.post(
+        response = self.session.post(
             url=url,
             data=xml,
             headers=headers,
-            auth=(self.username, self.password)
+            auth=self.auth
         )
 
         # Return with error if this doesn't work
@@ -1793,6 +1846,24 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         if not workspace:
             workspace = self.catalog.get_default_workspace().name
 
+        self._upload_coverage(workspace, coverage_name, coverage_type, coverage_file)
+
+        if default_style:
+            # Add styles to new layer
+            self.update_layer_styles(
+                layer_id=layer_id,
+                default_style=default_style,
+                other_styles=other_styles
+            )
+
+        # The coverage store is named after the coverage
+        response_dict = self.get_layer(layer_id, coverage_name, debug)
+        return response_dict
+
+    def _upload_coverage(self, workspace, coverage_name, coverage_type, coverage_file):
+        """
+        Prepare the coverage file and upload it as a new coverage store with one coverage. Makes no catalog calls.
+        """
         # Validate coverage type
         if coverage_type not in self.VALID_COVERAGE_TYPES:
             exception = ValueError('"{0}" is not a valid coverage_type. Use either {1}'.format(
@@ -1806,180 +1877,224 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         # Prepare files
         working_dir = tempfile.mkdtemp()
 
-        # Unzip to working directory if zip file
-        if is_zipfile(coverage_file):
-            zip_file = ZipFile(coverage_file)
-            zip_file.extractall(working_dir)
-        # Otherwise, copy to working directory
-        else:
-            shutil.copy2(coverage_file, working_dir)
-
-        # Convert GrassGrids to ArcGrids
-        if coverage_type == self.CT_GRASS_GRID:
-            working_dir_contents = os.listdir(working_dir)
-            num_working_dir_items = len(working_dir_contents)
-            if num_working_dir_items > 2:
-                exception = ValueError('Expected 1 or 2 files for coverage type "{}" but got {} instead: "{}"'.format(
-                    self.CT_GRASS_GRID,
-                    num_working_dir_items,
-                    '", "'.join(working_dir_contents)
-                ))
-                log.error(exception)
-                raise exception
+        # Removed whether or not the upload succeeds, so failed layers of a batch leave nothing behind
+        try:
+            # Unzip to working directory if zip file
+            if is_zipfile(coverage_file):
+                zip_file = ZipFile(coverage_file)
+                zip_file.extractall(working_dir)
+            # Otherwise, copy to working directory
+            else:
+                shutil.copy2(coverage_file, working_dir)
+
+            # Convert GrassGrids to ArcGrids
+            if coverage_type == self.CT_GRASS_GRID:
+                # Directory entries carry their file type, so skipping directories needs no extra stat calls
+                with os.scandir(working_dir) as entries:
+                    working_dir_contents = list(entries)
+                num_working_dir_items = len(working_dir_contents)
+                if num_working_dir_items > 2:
+                    exception = ValueError(
+                        'Expected 1 or 2 files for coverage type "{}" but got {} instead: "{}"'.format(
+                            self.CT_GRASS_GRID,
+                            num_working_dir_items,
+                            '", "'.join(entry.name for entry in working_dir_contents)
+                        )
+                    )
+                    log.error(exception)
+                    raise exception
 
-            for item in working_dir_contents:
-                # Skip directories
-                if os.path.isdir(os.path.join(working_dir, item)):
-                    continue
+                for entry in working_dir_contents:
+                    # Skip directories
+                    if entry.is_dir():
+                        continue
 
-                # Skip the projection file
-                if 'prj' in item:
-                    continue
+                    # Skip the projection file
+                    if 'prj' in entry.name:
+                        continue
 
-                # Assume other file is the raster
-                corrupt_file = False
-                tmp_coverage_path = os.path.join(working_dir, item)
-
-                with open(tmp_coverage_path, 'r') as item:
-                    contents = item.readlines()
-
-                for line in contents[0:6]:
-                    if 'north' in line:
-                        north = float(line.split(':')[1].strip())
-                    elif 'south' in line:
-                        south = float(line.split(':')[1].strip())
-                    elif 'east' in line:
-                        pass  # we don't use east in this algorithm so skip it.
-                    elif 'west' in line:
-                        west = float(line.split(':')[1].strip())
-                    elif 'rows' in line:
-                        rows = int(line.split(':')[1].strip())
-                    elif 'cols' in line:
-                        cols = int(line.split(':')[1].strip())
-                    else:
-                        corrupt_file = True
+                    # Assume other file is the raster
+                    corrupt_file = False
+                    tmp_coverage_path = entry.path
+
+                    with open(tmp_coverage_path, 'r') as item:
+                        contents = item.readlines()
+
+                    for line in contents[0:6]:
+                        if 'north' in line:
+                            north = float(line.split(':')[1].strip())
+                        elif 'south' in line:
+                            south = float(line.split(':')[1].strip())
+                        elif 'east' in line:
+                            pass  # we don't use east in this algorithm so skip it.
+                        elif 'west' in line:
+                            west = float(line.split(':')[1].strip())
+                        elif 'rows' in line:
+                            rows = int(line.split(':')[1].strip())
+                        elif 'cols' in line:
+                            cols = int(line.split(':')[1].strip())
+                        else:
+                            corrupt_file = True
 
-                if corrupt_file:
-                    exception = IOError('GRASS file could not be processed, check to ensure the GRASS grid is '
-                                        'correctly formatted or included.')
-                    log.error(exception)
-                    raise exception
+                    if corrupt_file:
+                        exception = IOError('GRASS file could not be processed, check to ensure the GRASS grid is '
+                                            'correctly formatted or included.')
+                        log.error(exception)
+                        raise exception
+
+                    # Calculate new header
+                    xllcorner = west
+                    yllcorner = south
+                    cellsize = (north - south) / rows
+
+                    header = ['ncols         {0}\n'.format(cols),
+                              'nrows         {0}\n'.format(rows),
+                              'xllcorner     {0}\n'.format(xllcorner),
+                              'yllcorner     {0}\n'.format(yllcorner),
+                              'cellsize      {0}\n'.format(cellsize)]
+
+                    # Strip off old header and add new one
+                    for _ in range(0, 6):
+                        contents.pop(0)
+                    contents = header + contents
+
+                    # Write the coverage to file
+                    with open(tmp_coverage_path, 'w') as o:
+                        for line in contents:
+                            # Make sure the file ends with a new line
+                            if line[-1] != '\n':
+                                line = line + '\n'
+
+                            o.write(line)
+
+            # Prepare Files
+            coverage_archive_name = coverage_name + '.zip'
+            coverage_archive = os.path.join(working_dir, coverage_archive_name)
+            with ZipFile(coverage_archive, 'w') as zf:
+                for item in os.listdir(working_dir):
+                    if item != coverage_archive_name:
+                        zf.write(os.path.join(working_dir, item), item)
+
+            content_type = 'application/zip'
+
+            # Prepare headers
+            headers = {
+                "Content-type": content_type,
+                "Accept": "application/xml"
+            }
 
-                # Calculate new header
-                xllcorner = west
-                yllcorner = south
-                cellsize = (north - south) / rows
-
-                header = ['ncols         {0}\n'.format(cols),
-                          'nrows         {0}\n'.format(rows),
-                          'xllcorner     {0}\n'.format(xllcorner),
-                          'yllcorner     {0}\n'.format(yllcorner),
-                          'cellsize      {0}\n'.format(cellsize)]
-
-                # Strip off old header and add new one
-                for _ in range(0, 6):
-                    contents.pop(0)
-                contents = header + contents
-
-                # Write the coverage to file
-                with open(tmp_coverage_path, 'w') as o:
-                    for line in contents:
-                        # Make sure the file ends with a new line
-                        if line[-1] != '\n':
-                            line = line + '\n'
-
-                        o.write(line)
-
-        # Prepare Files
-        coverage_archive_name = coverage_name + '.zip'
-        coverage_archive = os.path.join(working_dir, coverage_archive_name)
-        with ZipFile(coverage_archive, 'w') as zf:
-            for item in os.listdir(working_dir):
-                if item != coverage_archive_name:
-                    zf.write(os.path.join(working_dir, item), item)
-
-        files = {'file': open(coverage_archive, 'rb')}
-        content_type = 'application/zip'
+            # Prepare URL
+            extension = coverage_type.lower()
 
-        # Prepare headers
-        headers = {
-            "Content-type": content_type,
-            "Accept": "application/xml"
-        }
+            if coverage_type == self.CT_GRASS_GRID:
+                extension = self.CT_ARC_GRID.lower()
 
-        # Prepare URL
-        extension = coverage_type.lower()
+            url = self._assemble_url(
+                'workspaces', workspace, 'coveragestores', coverage_store_name, f'file.{extension}'
+            )
 
-        if coverage_type == self.CT_GRASS_GRID:
-            extension = self.CT_ARC_GRID.lower()
+            # Set params
+            params = {'coverageName': coverage_name}
 
-        url = self._assemble_url(
-            'workspaces', workspace, 'coveragestores', coverage_store_name, 'file.{0}'.format(extension)
-        )
+            retries_remaining = 3
+            zip_error_retries = 5
+            raise_error = False
+
+            # Stream the archive from disk rather than building the request body in memory
+            with open(coverage_archive, 'rb') as archive:
+                while True:
+                    # Rewind, in case this is a retry
+                    archive.seek(0)
+
+                    if coverage_type == self.CT_IMAGE_MOSAIC:
+                        # Image mosaic doesn't need params argument.
+                        response = self.session.put(
+                            url=url,
+                            data=archive,
+                            headers=headers,
+                            auth=self.auth
+                        )
+                    else:
+                        response = self.session.put(
+                            url=url,
+                            data=archive,
+                            headers=headers,
+                            params=params,
+                            auth=self.auth
+                        )
+
+                    # Raise an exception if status code is not what we expect
+                    if response.status_code == 201:
+                        log.info('Successfully created coverage {}'.format(coverage_name))
+                        break
+                    if response.status_code == 500 and 'already exists' in response.text:
+                        log.warning('Coverage already exists {}'.format(coverage_name))
+                        break
+                    if response.status_code == 500 and 'Error occured unzipping file' in response.text:
+                        zip_error_retries -= 1
+                        if zip_error_retries == 0:
+                            raise_error = True
+                    else:
+                        retries_remaining -= 1
+                        if retries_remaining == 0:
+                            raise_error = True
 
-        # Set params
-        params = {'coverageName': coverage_name}
+                    if raise_error:
+                        msg = "Create Coverage Status Code {0}: {1}".format(response.status_code, response.text)
+                        exception = requests.RequestException(msg, response=response)
+                        log.error(exception)
+                        raise exception
+        finally:
+            shutil.rmtree(working_dir, ignore_errors=True)
 
-        retries_remaining = 3
-        zip_error_retries = 5
-        raise_error = False
-
-        while True:
-            if coverage_type == self.CT_IMAGE_MOSAIC:
-                # Image mosaic doesn't need params argument.
-                response = requests.put(
-                    url=url,
-                    files=files,
-                    headers=headers,
-                    auth=(self.username, self.password)
-                )
-            else:
-                response = requests.put(
-                    url=url,
-                    files=files,
-                    headers=headers,
-                    params=params,
-                    auth=(self.username, self.password)
-                )
+    def create_coverage_layers(self, layers):
+        """
+        Create several coverage layers, uploading their coverage files concurrently.
 
-            # Raise an exception if status code is not what we expect
-            if response.status_code == 201:
-                log.info('Successfully created coverage {}'.format(coverage_name))
-                break
-            if response.status_code == 500 and 'already exists' in response.text:
-                log.warning('Coverage already exists {}'.format(coverage_name))
-                break
-            if response.status_code == 500 and 'Error occured unzipping file' in response.text:
-                zip_error_retries -= 1
-                if zip_error_retries == 0:
-                    raise_error = True
-            else:
-                retries_remaining -= 1
-                if retries_remaining == 0:
-                    raise_error = True
+        Args:
+            layers (iterable): A dictionary of create_coverage_layer arguments for each layer (e.g.: {'layer_id': 'workspace:name', 'coverage_type': 'GeoTIFF', 'coverage_file': '/path/to/file.tif'}).
 
-            if raise_error:
-                msg = "Create Coverage Status Code {0}: {1}".format(response.status_code, response.text)
-                exception = requests.RequestException(msg, response=response)
-                log.error(exception)
-                raise exception
+        Returns:
+            list: response dictionaries in the order of the layers. A layer that could not be created has a response with success False and the error message.
+        """  # noqa: E501
+        layers = list(layers)
+        errors = (ValueError, OSError, requests.RequestException)
 
-        # Clean up
-        files['file'].close()
+        # The gsconfig catalog is not safe to share between threads, so only the file preparation and uploads run
+        # concurrently. Catalog calls are made from this thread, before and after them.
+        default_workspace = None
+        if any(not self._process_identifier(layer['layer_id'])[0] for layer in layers):
+            default_workspace = self.catalog.get_default_workspace().name
 
-        if working_dir:
-            shutil.rmtree(working_dir)
+        def upload(layer):
+            workspace, coverage_name = self._process_identifier(layer['layer_id'])
+            try:
+                self._upload_coverage(workspace or default_workspace, coverage_name, layer['coverage_type'],
+                                      layer['coverage_file'])
+            except errors as e:
+                return str(e)
+
+        responses = []
+        for layer, error in zip(layers, self._map_concurrently(upload, layers)):
+            if error is None:
+                try:
+                    if layer.get('default_style'):
+                        self.update_layer_styles(
+                            layer_id=layer['layer_id'],
+                            default_style=layer['default_style'],
+                            other_styles=layer.get('other_styles')
+                        )
+
+                    # The coverage store is named after the coverage
+                    coverage_name = self._process_identifier(layer['layer_id'])[1]
+                    responses.append(self.get_layer(layer['layer_id'], coverage_name, layer.get('debug', False)))
+                    continue
+                except errors as e:
+                    error = str(e)
 
-        if default_style:
-            # Add styles to new layer
-            self.update_layer_styles(
-                layer_id=layer_id,
-                default_style=default_style,
-                other_styles=other_styles
-            )
+            responses.append({'success': False, 'error': error})
 
-        response_dict = self.get_layer(layer_id, coverage_store_name, debug)
-        return response_dict
+        return responses
 
     def create_layer_group(self, layer_group_id, layers, styles, debug=False):
         """
@@ -2015,22 +2130,18 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             'styles': styles
         }
 
-        # Open layer group template
-        template_path = os.path.join(self.XML_PATH, 'layer_group_template.xml')
+        # Render layer group template
         url = self._assemble_url('workspaces', workspace, 'layergroups.json')
         headers = {
             "Content-type": "text/xml"
         }
 
-        with open(template_path, 'r') as template_file:
-            text = template_file.read()
-            template = Template(text)
-            xml = template.render(context)
+        xml = self._xml_template('layer_group_template.xml').render(context)
 
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=headers,
-            auth=(self.username, self.password),
+            auth=self.auth,
             data=xml,
         )
 
@@ -2112,10 +2223,10 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             template = Template(text)
             text = template.render(sld_context)
 
-        response = requests.post(
+        response = self.session.post(
             url,
             headers=headers,
-            auth=(self.username, self.password),
+            auth=self.auth,
             params={'name': style_name},
             data=text
         )
@@ -2228,12 +2339,11 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
 
             # Handle tile caching properties (gsconfig doesn't support this)
             if tile_caching is not None:
-                gwc_url = '{0}layers/{1}.xml'.format(self.gwc_endpoint, layer_id)
-                auth = (self.username, self.password)
+                gwc_url = f'{self.gwc_endpoint}layers/{layer_id}.xml'
                 xml = ConvertDictToXml({'GeoServerLayer': tile_caching})
-                r = requests.post(
+                r = self.session.post(
                     gwc_url,
-                    auth=auth,
+                    auth=self.auth,
                     headers={'Content-Type': 'text/xml'},
                     data=ElementTree.tostring(xml)
                 )
@@ -2329,24 +2439,20 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             'geoserver_rest_endpoint': self.endpoint
         }
 
-        # Open layer template
-        layer_path = os.path.join(self.XML_PATH, 'layer_template.xml')
-        url = self._assemble_url('layers', '{0}.xml'.format(layer_name))
+        # Render layer template
+        url = self._assemble_url('layers', f'{layer_name}.xml')
         headers = {
             "Content-type": "text/xml"
         }
 
-        with open(layer_path, 'r') as layer_file:
-            text = layer_file.read()
-            template = Template(text)
-            xml = template.render(context)
+        xml = self._xml_template('layer_template.xml').render(context)
 
         retries_remaining = 3
         while retries_remaining > 0:
-            response = requests.put(
+            response = self.session.put(
                 url,
                 headers=headers,
-                auth=(self.username, self.password),
+                auth=self.auth,
                 data=xml,
             )
 
@@ -2419,9 +2525,9 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
 
         json = {'recurse': recurse}
 
-        response = requests.delete(
+        response = self.session.delete(
             url,
-            auth=(self.username, self.password),
+            auth=self.auth,
             headers=headers,
             params=json
         )
@@ -2452,8 +2558,8 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         if not workspace:
             workspace = self.catalog.get_default_workspace().name
 
-        url = self._assemble_url('workspaces', workspace, 'layergroups', '{0}'.format(group_name))
-        response = requests.delete(url, auth=(self.username, self.password))
+        url = self._assemble_url('workspaces', workspace, 'layergroups', group_name)
+        response = self.session.delete(url, auth=self.auth)
         if response.status_code != 200:
             if response.status_code == 404 and "No such layer group" in response.text:
                 pass
@@ -2560,11 +2666,11 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         json = {'recurse': recurse, 'purge': purge}
 
         # Execute: DELETE /workspaces/<ws>/coveragestores/<cs>
-        response = requests.delete(
+        response = self.session.delete(
             url=url,
             headers=headers,
             params=json,
-            auth=(self.username, self.password)
+            auth=self.auth
         )
 
         if response.status_code != 200:
@@ -2604,9 +2710,9 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
 
         params = {'purge': purge}
 
-        response = requests.delete(
+        response = self.session.delete(
             url=url,
-            auth=(self.username, self.password),
+            auth=self.auth,
             headers=headers,
             params=params
         )
@@ -2629,21 +2735,32 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         Validate the GeoServer spatial dataset engine. Will throw and error if not valid.
         """
         try:
-            r = requests.get(self.endpoint, auth=(self.username, self.password))
+            # Streamed, so only the start of the landing page is downloaded
+            r = self.session.get(self.endpoint, auth=self.auth, stream=True)
 
         except requests.exceptions.MissingSchema:
             raise AssertionError('The URL "{0}" provided for the GeoServer spatial dataset service endpoint is '
                                  'invalid.'.format(self.endpoint))
 
-        if r.status_code == 401:
-            raise AssertionError('The username and password of the GeoServer spatial dataset service engine are '
-                                 'not valid.')
-
-        if r.status_code != 200:
-            raise AssertionError('The URL "{0}" is not a valid GeoServer spatial dataset service '
-                                 'endpoint.'.format(self.endpoint))
-
-        if 'Geoserver Configuration API' not in r.text:
+        try:
+            if r.status_code == 401:
+                raise AssertionError('The username and password of the GeoServer spatial dataset service engine '
+                                     'are not valid.')
+
+            if r.status_code != 200:
+                raise AssertionError('The URL "{0}" is not a valid GeoServer spatial dataset service '
+                                     'endpoint.'.format(self.endpoint))
+
+            # chunk_size is only an upper bound, with chunked transfer encoding each HTTP chunk comes back on its own
+            page_head = bytearray()
+            for chunk in r.iter_content(chunk_size=self.VALIDATE_READ_BYTES):
+                page_head += chunk
+                if len(page_head) >= self.VALIDATE_READ_BYTES:
+                    break
+        finally:
+            r.close()
+
+        if b'Geoserver Configuration API' not in page_head:
             raise AssertionError('The URL "{0}" is not a valid GeoServer spatial dataset service '
                                  'endpoint.'.format(self.endpoint))
 
@@ -2684,22 +2801,17 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
 
         if operation == self.GWC_OP_MASS_TRUNCATE:
             url = self.get_gwc_endpoint() + 'masstruncate/'
-            xml_text = '<truncateLayer><layerName>{}:{}</layerName></truncateLayer>'.format(workspace, name)
+            xml_text = f'<truncateLayer><layerName>{escape(workspace)}:{escape(name)}</layerName></truncateLayer>'
 
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
-                auth=(self.username, self.password),
+                auth=self.auth,
                 data=xml_text
             )
 
         else:
             url = self.get_gwc_endpoint() + 'seed/' + workspace + ':' + name + '.xml'
-            xml = os.path.join(self.XML_PATH, 'gwc_tile_cache_operation_template.xml')
-
-            # Open XML file
-            with open(xml, 'r') as sld_file:
-                text = sld_file.read()
 
             # Compose XML context
             xml_context = {
@@ -2715,14 +2827,13 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                 'bounds': bounds
             }
 
-            # Render the XML template
-            template = Template(text)
-            rendered = template.render(xml_context)
+            # Render the XML template, escaping names and parameters that contain XML markup (e.g.: "&")
+            rendered = self._xml_template('gwc_tile_cache_operation_template.xml', autoescape=True).render(xml_context)
 
-            response = requests.post(
+            response = self.session.post(
                 url,
                 headers=headers,
-                auth=(self.username, self.password),
+                auth=self.auth,
                 data=rendered
             )
 
@@ -2742,6 +2853,49 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
         response_dict = {'success': True, 'result': None}
         return response_dict
 
+    def modify_tile_caches(self, layer_ids, operation, **kwargs):
+        """
+        Modify the GWC tile cache for several layers. GWC takes one layer per request, so the requests are submitted concurrently.
+
+        Args:
+            layer_ids (iterable): Identifiers of the layers. Each can be a name or a workspace-name combination (e.g.: "name" or "workspace:name").
+            operation (str): operation type either 'seed', 'reseed', 'truncate', or 'masstruncate'.
+            **kwargs: other arguments of modify_tile_cache (e.g.: zoom_start, zoom_end, bounds), applied to every layer.
+
+        Returns:
+            dict: response dictionary with the error messages of the layers whose operation could not be submitted.
+
+        Raises:
+            ValueError: if invalid value is provided for an argument.
+        """  # noqa: E501
+        if operation not in self.GWC_OPERATIONS:
+            raise ValueError('Invalid value "{}" provided for argument "operation". Must be "{}".'.format(
+                operation, '" or "'.join(self.GWC_OPERATIONS))
+            )
+
+        # The gsconfig catalog is not safe to share between threads, so layers without a workspace get the default
+        # one here rather than in the workers
+        layer_ids = list(layer_ids)
+        identifiers = [self._process_identifier(layer_id) for layer_id in layer_ids]
+        if any(not workspace for workspace, _ in identifiers):
+            default_workspace = self.catalog.get_default_workspace().name
+            layer_ids = [f'{workspace or default_workspace}:{name}' for workspace, name in identifiers]
+
+        def modify_layer(layer_id):
+            try:
+                self.modify_tile_cache(layer_id, operation, **kwargs)
+            except requests.RequestException as e:
+                return str(e)
+
+        response_dict = {'success': True, 'result': None, 'error': []}
+        for msg in self._map_concurrently(modify_layer, layer_ids):
+            if msg:
+                response_dict['success'] = False
+                response_dict['error'].append(msg)
+
+        response_dict.pop('error', None) if not response_dict['error'] else response_dict.pop('result', None)
+        return response_dict
+
     def terminate_tile_cache_tasks(self, layer_id, kill='all'):
         """
         Terminate running tile cache processes for given layer.
@@ -2768,9 +2922,9 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
 
         url = self.get_gwc_endpoint() + 'seed/' + workspace + ':' + name
 
-        response = requests.post(
+        response = self.session.post(
             url,
-            auth=(self.username, self.password),
+            auth=self.auth,
             data={'kill_all': kill}
         )
 
@@ -2805,28 +2959,19 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
             workspace = self.catalog.get_default_workspace().name
 
         url = self.get_gwc_endpoint() + 'seed/' + workspace + ':' + name + '.json'
-        status_list = []
 
-        response = requests.get(
+        response = self.session.get(
             url,
-            auth=(self.username, self.password),
+            auth=self.auth,
         )
 
         if response.status_code == 200:
             status = response.json()
-
-            if 'long-array-array' in status:
-                for s in status['long-array-array']:
-                    temp_dict = {
-                        'tiles_processed': s[0],
-                        'total_to_process': s[1],
-                        'num_remaining': s[2],
-                        'task_id': s[3],
-                        'task_status': self.GWC_STATUS_MAP[s[4]] if s[4] in self.GWC_STATUS_MAP else s[4]
-                    }
-
-                    status_list.append(dict(temp_dict))
-            return status_list
+            status_map = self.GWC_STATUS_MAP
+            return [
+                {**dict(zip(self.GWC_TASK_FIELDS, s)), 'task_status': status_map.get(s[4], s[4])}
+                for s in status.get('long-array-array', ())
+            ]
         else:
             msg = 'Unable to terminate tile cache tasks for layer {}:{}. {}:{}'.format(
                 workspace, name, response.status_code, response.text
@@ -2865,10 +3010,10 @@ class GeoServerSpatialDatasetEngine(SpatialDatasetEngine):
                     </dimensionInfo>\
                     </entry></metadata>\
                     </coverage>'
-        response = requests.put(
+        response = self.session.put(
             url,
             headers=headers,
-            auth=(self.username, self.password),
+            auth=self.auth,
             data=data_xml,
         )
 